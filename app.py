@@ -1,22 +1,23 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import requests
-from bs4 import BeautifulSoup
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import re
 from collections import Counter
 from datetime import datetime
 import time
 import io
+import json
+import sqlite3
+import threading
+import hashlib
 import os
 import importlib.util
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Auto-install helper for missing packages (best-effort) ---
 def try_install(package_name, import_name=None):
@@ -70,7 +71,6 @@ def add_pwa_support():
             {"src": "icon-512.png", "sizes": "512x512", "type": "image/png"}
         ]
     }
-    import json
     # ensure manifest json won't break injected script
     m = json.dumps(manifest).replace('"', '\\"')
     html = f"""
@@ -102,19 +102,39 @@ def add_auto_refresh(interval=30):
     html = f'<script>setTimeout(function(){{window.parent.location.reload();}},{interval*1000});</script>'
     components.html(html, height=0)
 
-# NLTK Setup
-for c in ['stopwords', 'punkt', 'punkt_tab']:
-    try:
-        # corpora vs tokenizers path detection
-        if c == 'stopwords':
-            nltk.data.find(f'corpora/{c}')
-        else:
-            nltk.data.find(f'tokenizers/{c}')
-    except:
-        try:
-            nltk.download(c, quiet=True)
-        except:
-            pass
+# Stopwords for keyword extraction: NLTK's English list (nltk.corpus.stopwords), inlined
+# so startup needs neither the nltk import nor its data lookups/downloads. Heavy
+# libraries (sklearn, bs4) are imported where first used, so the category picker paints
+# without loading them.
+NLTK_ENGLISH_STOPWORDS = frozenset({
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're", "you've",
+    "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his',
+    'himself', 'she', "she's", 'her', 'hers', 'herself', 'it', "it's", 'its', 'itself',
+    'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this',
+    'that', "that'll", 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an', 'the',
+    'and', 'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for',
+    'with', 'about', 'against', 'between', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under',
+    'again', 'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
+    'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don',
+    "don't", 'should', "should've", 'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren',
+    "aren't", 'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't", 'hadn', "hadn't",
+    'hasn', "hasn't", 'haven', "haven't", 'isn', "isn't", 'ma', 'mightn', "mightn't", 'mustn',
+    "mustn't", 'needn', "needn't", 'shan', "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't",
+    'weren', "weren't", 'won', "won't", 'wouldn', "wouldn't",
+})
+NEWS_STOPWORDS = {'said', 'new', 'year', 'people', 'time', 'day', 'also', 'would', 'could', 'report', 'news'}
+KEYWORD_STOPWORDS = NLTK_ENGLISH_STOPWORDS | NEWS_STOPWORDS
+
+# Lightweight tokenizers (replace NLTK Punkt / word_tokenize; rough splits are enough here)
+# Sentence ends: [.!?] before a capital, digit or Indic letter, or a Devanagari danda
+_SENT_RE = re.compile(r'(?<=[.!?])\s+(?=["\'“‘(]?[A-Z0-9\u0900-\u0DFF])|(?<=[।॥])\s+')
+_WORD_RE = re.compile(r'[a-z]{4,}')
+
+def fast_sent_tokenize(text):
+    return [s for s in _SENT_RE.split(text.strip()) if s]
 
 # Languages
 LANGUAGES = {
@@ -123,6 +143,9 @@ LANGUAGES = {
     "🇮🇳 मराठी": ("mr", "mr-IN"),
     "🇮🇳 ಕನ್ನಡ": ("kn", "kn-IN")
 }
+# Built once; the header reads these on every rerun
+LANGUAGE_KEYS = tuple(LANGUAGES.keys())
+LANGUAGE_CODES = tuple(v[0] for v in LANGUAGES.values())
 
 # Translation dictionaries for UI
 TRANSLATIONS = {
@@ -163,36 +186,136 @@ def translate_ui(text, lang_code):
         return text
     return TRANSLATIONS.get(lang_code, {}).get(text, text)
 
+def text_digest(text):
+    """Short content hash, so identical texts (e.g. wire reposts) share cache entries."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
 # Translation of summary text using deep_translator (chunking)
+def _translate_uncached(text, target_lang):
+    translator = GoogleTranslator(source='auto', target=target_lang)
+    max_len = 4500
+    if len(text) <= max_len:
+        return translator.translate(text)
+    # chunk by sentences: track a running length and join each chunk's slice once,
+    # instead of growing a string sentence by sentence
+    sents = fast_sent_tokenize(text)
+    out = []
+    start, run = 0, 0
+    for i, s in enumerate(sents):
+        if run + len(s) + 1 >= max_len and i > start:
+            out.append(translator.translate(" ".join(sents[start:i])))
+            start, run = i, 0
+        run += len(s) + 1
+    if start < len(sents):
+        out.append(translator.translate(" ".join(sents[start:])))
+    return " ".join(out)
+
+# Translate several texts at once: deep_translator's translate_batch still sends one
+# request per text, so the requests are issued concurrently instead
+TRANSLATE_WORKERS = 8
+TRANSLATE_EAGER = 5  # summaries translated before the feed renders; the rest follow after
+
 @st.cache_data(ttl=3600)
-def translate_text(text, target_lang):
-    if GoogleTranslator is None:
-        return text
-    if not text or target_lang == "en":
-        return text
-    try:
-        max_len = 4500
-        if len(text) <= max_len:
-            return GoogleTranslator(source='auto', target=target_lang).translate(text)
-        # chunk by sentences
-        sents = sent_tokenize(text)
-        out = []
-        cur = ""
-        for s in sents:
-            if len(cur) + len(s) + 1 < max_len:
-                cur += s + " "
-            else:
-                out.append(GoogleTranslator(source='auto', target=target_lang).translate(cur.strip()))
-                cur = s + " "
-        if cur.strip():
-            out.append(GoogleTranslator(source='auto', target=target_lang).translate(cur.strip()))
-        return " ".join(out)
-    except Exception as e:
+def translate_texts(texts, target_lang):
+    if GoogleTranslator is None or target_lang == "en":
+        return list(texts)
+    errors = []
+    def _one(text):
+        if not text:
+            return text
+        try:
+            return _translate_uncached(text, target_lang)
+        except Exception as e:
+            errors.append(e)
+            return text
+    with ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS) as ex:
+        out = list(ex.map(_one, texts))
+    if errors:
         try:
-            st.warning(f"Translation error: {e}")
+            st.warning(f"Translation error: {errors[0]}")
         except:
             pass
-        return text
+    return out
+
+# Server-side speech synthesis via gTTS. Cached across reruns and sessions, bounded by
+# max_entries; failures raise so they are not cached. Finished MP3s are also written to
+# AUDIO_DIR so a restart or a new worker process does not synthesize them again.
+TTS_WORKERS = 4
+GTTS_SUPPORTED = frozenset({'en', 'hi', 'mr', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'zh-cn'})
+TTS_PIECE_CHARS = 100  # gTTS sends at most this many characters per request
+MIN_TTS_CHARS = 20  # below this there is nothing worth a synthesis round-trip
+_SPEAKABLE_RE = re.compile(r'\w')
+AUDIO_DIR = os.path.join('.cache', 'audio')
+AUDIO_DIR_MAX_FILES = 500
+
+def _synthesize_chunk(chunk, lang):
+    buf = io.BytesIO()
+    gTTS(text=chunk, lang=lang, slow=False).write_to_fp(buf)
+    return buf.getbuffer()  # a view, not a copy; the caller joins all pieces into one bytes object
+
+def _split_for_tts(text, limit=TTS_PIECE_CHARS):
+    """Sentences, with long ones cut at the last clause or word break that fits in `limit`."""
+    pieces = []
+    for s in fast_sent_tokenize(text) or [text]:
+        while len(s) > limit:
+            cut = max(s.rfind(', ', 0, limit), s.rfind('; ', 0, limit)) + 1
+            if cut <= 0:
+                cut = s.rfind(' ', 0, limit)
+            if cut <= 0:
+                cut = limit
+            pieces.append(s[:cut].strip())
+            s = s[cut:].strip()
+        pieces.append(s)
+    # gTTS rejects pieces with nothing to speak (e.g. a stray dash)
+    return [p for p in pieces if _SPEAKABLE_RE.search(p)]
+
+def _audio_path(text, lang):
+    return os.path.join(AUDIO_DIR, f"{text_digest(lang + '|' + text)}.mp3")
+
+def _read_audio_file(path):
+    try:
+        with open(path, 'rb') as f:
+            audio = f.read()
+        os.utime(path)  # mark as recently used for pruning
+        return audio or None
+    except:
+        return None
+
+def _write_audio_file(path, audio):
+    try:
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+        # write then rename, so a concurrent reader never sees a partial file
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp, path)
+        # keep the directory bounded: drop the least recently used files
+        entries = [e for e in os.scandir(AUDIO_DIR) if e.name.endswith('.mp3')]
+        if len(entries) > AUDIO_DIR_MAX_FILES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[:len(entries) - AUDIO_DIR_MAX_FILES]:
+                os.remove(e.path)
+    except:
+        pass
+
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def generate_tts_audio(text, lang):
+    path = _audio_path(text, lang)
+    audio = _read_audio_file(path)
+    if audio:
+        return audio
+    # gTTS fetches its pieces one request at a time; cut the text into request-sized
+    # pieces ourselves, synthesize them concurrently and join them in order (MP3 frames
+    # concatenate cleanly)
+    chunks = _split_for_tts(text) or [text]
+    if len(chunks) == 1:
+        parts = [_synthesize_chunk(chunks[0], lang)]
+    else:
+        with ThreadPoolExecutor(max_workers=TTS_WORKERS) as ex:
+            parts = list(ex.map(_synthesize_chunk, chunks, [lang] * len(chunks)))
+    audio = b"".join(parts)
+    _write_audio_file(path, audio)
+    return audio
 
 # Categories (same as original)
 CATEGORIES = {
@@ -245,6 +368,7 @@ CATEGORIES = {
         ("Express", "https://indianexpress.com/")
     ]
 }
+CATEGORY_KEYS = tuple(CATEGORIES.keys())
 
 # Title cleaning and robust extraction
 def extract_title_from_soup(soup):
@@ -274,6 +398,12 @@ def extract_title_from_soup(soup):
         return h1.get_text(strip=True)
     return "Article"
 
+# Title cleanup patterns, compiled once
+_NEWSNEWS_RE = re.compile(r'NewsNews', re.IGNORECASE)
+_SITE_TOKENS = [' - BBC', ' - Reuters', ' - CNN', ' - The Hindu', ' - NDTV', ' - ESPN', ' - Variety', ' - TechCrunch', ' - Bloomberg', ' - Guardian', ' | BBC', ' | Reuters']
+_SITE_TOKENS_RE = re.compile('|'.join(map(re.escape, _SITE_TOKENS)))
+_TRAILING_SEP_RE = re.compile(r'(\s*[-|:]\s*)+$')
+
 def clean_title_for_display(raw_title):
     """
     Light touch cleaning for display: remove repeated site suffixes such as ' - BBC' etc
@@ -282,152 +412,302 @@ def clean_title_for_display(raw_title):
     """
     t = raw_title.strip()
     # Remove obvious duplicates like 'NewsNews' or repeated word
-    t = re.sub(r'NewsNews', 'News', t, flags=re.IGNORECASE)
-    # Remove trailing site names in common formats
-    site_tokens = [' - BBC', ' - Reuters', ' - CNN', ' - The Hindu', ' - NDTV', ' - ESPN', ' - Variety', ' - TechCrunch', ' - Bloomberg', ' - Guardian', ' | BBC', ' | Reuters']
-    for s in site_tokens:
-        if s in t:
-            t = t.replace(s, '')
+    t = _NEWSNEWS_RE.sub('News', t)
+    # Remove site names in common formats (single pass over all tokens)
+    t = _SITE_TOKENS_RE.sub('', t)
     # Remove trailing separators repeated
-    t = re.sub(r'(\s*[-|:]\s*)+$', '', t).strip()
+    t = _TRAILING_SEP_RE.sub('', t).strip()
     # If title is empty after cleaning, fallback to original raw_title
     if not t:
         return raw_title.strip()
     return t
 
-# Keyword extraction
+# Keyword extraction (deterministic per text, so cached across reruns and sessions)
+@st.cache_data(ttl=3600, max_entries=1000, show_spinner=False)
 def get_keywords(text, n=5):
     try:
-        t = text.lower()
-        words = word_tokenize(t)
-        stops = set(stopwords.words('english'))
-        stops.update(['said', 'new', 'year', 'people', 'time', 'day', 'also', 'would', 'could', 'report', 'news'])
-        filtered = [w for w in words if len(w) >= 4 and w.isalpha() and w not in stops]
+        # one regex pass yields alphabetic tokens of length >= 4
+        words = _WORD_RE.findall(text.lower())
+        filtered = [w for w in words if w not in KEYWORD_STOPWORDS]
         if not filtered:
             return []
-        from nltk.util import ngrams
-        bg = [' '.join(b) for b in ngrams(filtered, 2)]
         wf = Counter(filtered)
-        bf = Counter(bg)
+        # count bigram tuples directly; only the top ones get joined into strings
+        bf = Counter(zip(filtered, filtered[1:]))
         cands = [(w.capitalize(), f*2) for w, f in wf.most_common(n*3) if f >= 2]
-        cands += [(' '.join([x.capitalize() for x in b.split()]), f*4) for b, f in bf.most_common(n*2) if f >= 2]
-        seen = set()
+        cands += [(f'{a.capitalize()} {b.capitalize()}', f*4) for (a, b), f in bf.most_common(n*2) if f >= 2]
+        # drop candidates overlapping an accepted one; lowercase each candidate once and
+        # test "kl inside any accepted" with a single scan of a separator-joined string
         unique = []
+        accepted_lc = []
+        accepted_joined = "\n"
         for k, s in cands:
             kl = k.lower()
-            if kl not in seen and not any(kl in u.lower() or u.lower() in kl for u, _ in unique):
-                seen.add(kl)
-                unique.append((k, s))
+            if kl in accepted_joined or any(a in kl for a in accepted_lc):
+                continue
+            accepted_lc.append(kl)
+            accepted_joined += kl + "\n"
+            unique.append((k, s))
         unique.sort(key=lambda x: x[1], reverse=True)
         return [k for k, _ in unique[:n]]
     except:
         return []
 
-# Article fetching logic (improved title extraction)
-def fetch_article(url):
-    h = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+# Shared HTTP session: keep-alive + connection pooling across all article fetches
+FETCH_WORKERS = 12
+CONNECT_TIMEOUT = 4  # fail fast on dead hosts so one slow link doesn't stall the whole batch
+MAX_ARTICLE_BYTES = 500_000  # download cap per article page
+
+# st.cache_resource keeps one session (and its open sockets) for the process lifetime
+# instead of building a new pool on every rerun
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+    # retry dropped connections once more, but never re-wait on a slow read
+    retries = Retry(total=2, read=0, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = get_http_session()
+
+# On-disk article cache: unlike st.cache_data it survives restarts, so pages fetched in the
+# last ARTICLE_DB_TTL seconds are not downloaded again after a redeploy
+ARTICLE_DB_PATH = os.path.join('.cache', 'articles.db')
+ARTICLE_DB_TTL = 1800
+
+# Opening raises on failure, so st.cache_resource does not keep a "no cache" result and
+# the next call tries again.
+@st.cache_resource(show_spinner=False)
+def get_article_db():
+    os.makedirs(os.path.dirname(ARTICLE_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(ARTICLE_DB_PATH, check_same_thread=False)
+    # WAL with synchronous=NORMAL: commits don't wait on a disk sync while holding the lock
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, ts REAL, payload TEXT)')
+    conn.commit()
+    # fetch workers share the connection, so access is serialized
+    return conn, threading.Lock()
+
+def _db_get_article(url):
+    try:
+        conn, lock = get_article_db()
+        with lock:
+            row = conn.execute('SELECT payload FROM articles WHERE url = ? AND ts > ?', (url, time.time() - ARTICLE_DB_TTL)).fetchone()
+        if not row:
+            return None
+        # JSON rather than pickle: a tampered cache file can't run code
+        article = json.loads(row[0])
+        article['time'] = datetime.fromisoformat(article['time'])
+        return article
+    except:
+        return None
+
+def _db_put_article(url, article):
     try:
-        r = requests.get(url, headers=h, timeout=12)
+        conn, lock = get_article_db()
+        payload = json.dumps({**article, 'time': article['time'].isoformat()})
+        now = time.time()
+        with lock:
+            conn.execute('INSERT OR REPLACE INTO articles VALUES (?, ?, ?)', (url, now, payload))
+            # expired rows are pruned on every write, so the file stays bounded by the TTL
+            conn.execute('DELETE FROM articles WHERE ts < ?', (now - ARTICLE_DB_TTL,))
+            conn.commit()
+    except:
+        pass
+
+# Class names that mark the main article container (matched per class value)
+_CONTAINER_CLASS_RE = re.compile(r'article|story|content|post|body', re.IGNORECASE)
+
+# Article fetching logic (improved title extraction)
+# Cached per URL for a few minutes so reruns, "Load 10 More" and other sessions reuse pages.
+# Network and parse errors raise out of the cached function so they are not cached; a
+# page without enough article text is a real result and returns None.
+@st.cache_data(ttl=300, max_entries=200, show_spinner=False)
+def _fetch_article(url):
+    cached = _db_get_article(url)
+    if cached:
+        return cached
+    from bs4 import BeautifulSoup
+    # stream and stop after MAX_ARTICLE_BYTES: the text we keep sits near the top of
+    # the page, so the tail of heavy pages is neither downloaded nor parsed
+    with SESSION.get(url, timeout=(CONNECT_TIMEOUT, 12), stream=True) as r:
         r.raise_for_status()
-        r.encoding = r.apparent_encoding
-        soup = BeautifulSoup(r.text, 'html.parser')
-        # remove boilerplate tags
-        for t in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            t.decompose()
-
-        title = extract_title_from_soup(soup)  # robust extraction
-
-        text = ""
-        # try to find main article containers with keywords in class
-        arts = soup.find_all(['article', 'div', 'main'], class_=lambda x: x and any(k in str(x).lower() for k in ['article', 'story', 'content', 'post', 'body']))
-        if arts:
-            for a in arts[:3]:
-                ps = a.find_all('p')
-                for p in ps:
-                    pt = p.get_text(strip=True)
-                    # avoid tiny caption-like paragraphs
-                    if len(pt) > 30:
-                        text += pt + ' '
-                if len(text) > 300:
-                    break
-        # fallback to all paragraphs
-        if len(text) < 200:
-            ps = soup.find_all('p')
+        html = r.raw.read(MAX_ARTICLE_BYTES, decode_content=True)
+    # hand raw bytes to lxml so charset detection happens in C
+    soup = BeautifulSoup(html, 'lxml')
+    # remove boilerplate tags
+    for t in soup(["script", "style", "nav", "footer", "header", "aside"]):
+        t.decompose()
+
+    title = extract_title_from_soup(soup)  # robust extraction
+
+    text = ""
+    # try to find main article containers with keywords in class
+    arts = soup.find_all(['article', 'div', 'main'], class_=_CONTAINER_CLASS_RE)
+    if arts:
+        for a in arts[:3]:
+            ps = a.find_all('p')
             for p in ps:
                 pt = p.get_text(strip=True)
+                # avoid tiny caption-like paragraphs
                 if len(pt) > 30:
                     text += pt + ' '
-                if len(text) > 500:
-                    break
-        text = ' '.join(text.split())
-        if text and len(text) > 150:
-            return {'title': title, 'url': url, 'content': text, 'time': datetime.now()}
-    except Exception as e:
-        # swallow network errors quietly
-        # optional: log or collect errors
-        pass
+            if len(text) > 300:
+                break
+    # fallback to all paragraphs
+    if len(text) < 200:
+        ps = soup.find_all('p')
+        for p in ps:
+            pt = p.get_text(strip=True)
+            if len(pt) > 30:
+                text += pt + ' '
+            if len(text) > 500:
+                break
+    text = ' '.join(text.split())
+    if text and len(text) > 150:
+        article = {'title': title, 'url': url, 'content': text, 'time': datetime.now()}
+        _db_put_article(url, article)
+        return article
     return None
 
-def fetch_category(url, max_articles=30, offset=0):
-    h = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    articles = []
+def fetch_article(url):
     try:
-        r = requests.get(url, headers=h, timeout=20)
-        r.raise_for_status()
-        r.encoding = r.apparent_encoding
-        soup = BeautifulSoup(r.text, 'html.parser')
-        links = []
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            if any(p in href.lower() for p in ['/article', '/story', '/news', '/20', '/blog', '/post']):
-                if any(s in href.lower() for s in ['video', 'gallery', 'podcast', 'live-reporting', 'javascript:', '#']):
-                    continue
-                if href.startswith('http'):
-                    links.append(href)
-                elif href.startswith('/'):
-                    base = '/'.join(url.split('/')[:3])
-                    links.append(base + href)
-            if len(links) >= (max_articles + offset) * 4:
-                break
+        return _fetch_article(url)
+    except:
+        # network/parse failure: skip this link; the next call retries it
+        return None
 
-        links = list(dict.fromkeys(links))
-        links = links[offset:offset + max_articles * 3]
+# Article-link filters for category pages (case-insensitive, one scan each per href)
+_LINK_ACCEPT_RE = re.compile(r'/(?:article|story|news|20|blog|post)', re.IGNORECASE)
+_LINK_REJECT_RE = re.compile(r'video|gallery|podcast|live-reporting|javascript:|#', re.IGNORECASE)
 
-        fetched = 0
-        for link in links:
-            if fetched >= max_articles:
-                break
-            a = fetch_article(link)
+# Like _fetch_article, failures raise so they are not cached: an unreachable listing page
+# or a batch where no article could be fetched is retried on the next call
+@st.cache_data(ttl=180, show_spinner=False)
+def _fetch_category(url, max_articles=30, offset=0):
+    from bs4 import BeautifulSoup
+    articles = []
+    r = SESSION.get(url, timeout=(CONNECT_TIMEOUT, 20))
+    r.raise_for_status()
+    # hand raw bytes to lxml so charset detection happens in C
+    soup = BeautifulSoup(r.content, 'lxml')
+    # dedupe while scanning and stop as soon as this page's slice of unique links is known
+    links = []
+    seen = set()
+    limit = offset + max_articles * 3
+    base = '/'.join(url.split('/')[:3])
+    for a in soup.find_all('a', href=True):
+        href = a['href']
+        if not _LINK_ACCEPT_RE.search(href) or _LINK_REJECT_RE.search(href):
+            continue
+        if href.startswith('http'):
+            link = href
+        elif href.startswith('/'):
+            link = base + href
+        else:
+            continue
+        if link in seen:
+            continue
+        seen.add(link)
+        links.append(link)
+        if len(links) >= limit:
+            break
+    links = links[offset:]
+
+    # fetch candidates concurrently (I/O bound); workers never touch st.session_state
+    ex = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        for a in ex.map(fetch_article, links):
             if a:
                 articles.append(a)
-                fetched += 1
-    except:
-        pass
+                if len(articles) >= max_articles:
+                    break
+    finally:
+        # drop queued links once we have enough articles
+        ex.shutdown(wait=False, cancel_futures=True)
+    if not articles:
+        raise LookupError(f"no articles fetched from {url}")
     return articles
 
-# Summarization function (same algorithm improved)
-def summarize(text, n=6):
-    sents = sent_tokenize(text)
-    if len(sents) <= n:
-        return ' '.join(sents)
+def fetch_category(url, max_articles=30, offset=0):
     try:
-        vec = TfidfVectorizer(stop_words='english', max_features=200, ngram_range=(1,2))
-        sv = vec.fit_transform(sents)
-        dv = vec.transform([' '.join(sents)])
-        scores = cosine_similarity(sv, dv).flatten()
+        return _fetch_category(url, max_articles, offset)
+    except:
+        return []
+
+# Summarization function (same algorithm improved)
+# Stateless hashing vectorizer: no per-article vocabulary fit (IDF over one article's
+# sentences carried little signal anyway), so a single instance is shared.
+# Rows are left as raw counts so their sum is the whole-document vector.
+@st.cache_resource(show_spinner=False)
+def get_summary_vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    # float32 halves the bytes moved through the normalize/dot steps; scores only need ranking
+    return HashingVectorizer(stop_words='english', n_features=2**12, ngram_range=(1,2), alternate_sign=False, norm=None, dtype=np.float32)
+
+def _pick_summary(sents, counts, n):
+    """Top-n sentences of one article, in original order, given its sentence count rows."""
+    from sklearn.preprocessing import normalize
+    # document vector = sum of sentence counts; saves a second pass over the joined text
+    centroid = np.asarray(counts.sum(axis=0)).ravel()
+    centroid /= np.linalg.norm(centroid) + 1e-9
+    scores = normalize(counts) @ centroid  # cosine similarity per sentence
+
+    if len(scores) > 0:
+        scores[0] *= 1.3
 
-        if len(scores) > 0:
-            scores[0] *= 1.3
+    # partial sort: only the top n are needed, order is restored by position below
+    top = np.argpartition(scores, -n)[-n:]
+    summary_sents = [sents[i] for i in sorted(top.tolist())]
 
-        top = scores.argsort()[-n:][::-1]
-        summary_sents = [sents[i] for i in sorted(top.tolist())]
+    if 0 not in top and len(sents[0].split()) < 30:
+        summary_sents = [sents[0]] + summary_sents[1:]
 
-        if 0 not in top and len(sents[0].split()) < 30:
-            summary_sents = [sents[0]] + summary_sents[1:]
+    return ' '.join(summary_sents)
 
-        return ' '.join(summary_sents)
+# One vectorizer pass over every sentence of the page; each article is then scored on its
+# own row slice. Cached on the tuple of texts, so another session loading the same page
+# gets the summaries back without recomputing.
+@st.cache_data(ttl=3600, max_entries=200, show_spinner=False)
+def summarize_many(texts, n=6):
+    split = [fast_sent_tokenize(text) for text in texts]
+    out = [' '.join(sents) for sents in split]  # articles with <= n sentences stay whole
+    long_ids = [i for i, sents in enumerate(split) if len(sents) > n]
+    if not long_ids:
+        return out
+    try:
+        counts = get_summary_vectorizer().transform([s for i in long_ids for s in split[i]])
     except:
-        return ' '.join(sents[:n])
+        for i in long_ids:
+            out[i] = ' '.join(split[i][:n])
+        return out
+    start = 0
+    for i in long_ids:
+        end = start + len(split[i])
+        try:
+            out[i] = _pick_summary(split[i], counts[start:end], n)
+        except:
+            out[i] = ' '.join(split[i][:n])
+        start = end
+    return out
+
+# Runs on the script thread after fetching, not in the fetch workers: summaries are batched
+# over the whole page (summarize_many), and the fields go on the article dicts held in
+# st.session_state, which the workers never touch.
+def add_derived_fields(articles):
+    """Attach display title, summary and keywords once; later reruns read them off the dicts."""
+    todo = [art for art in articles if 'summary' not in art]
+    if todo:
+        summaries = summarize_many(tuple(art['content'] for art in todo), 6)
+        for art, summary in zip(todo, summaries):
+            art['display_title'] = clean_title_for_display(art.get('title', 'Article'))
+            art['summary'] = summary
+            art['keywords'] = get_keywords(art['content'], 5)
+    return articles
 
 def time_ago(dt):
     diff = datetime.now() - dt
@@ -511,8 +791,6 @@ if 'prev_language' not in st.session_state:
     st.session_state.prev_language = "en"
 if 'translated_articles' not in st.session_state:
     st.session_state.translated_articles = {}
-if 'audio_cache' not in st.session_state:
-    st.session_state.audio_cache = {}  # key -> bytes
 
 # Header
 col1, col2, col3 = st.columns([4, 1, 1])
@@ -523,10 +801,8 @@ with col2:
     if st.session_state.category and st.session_state.source:
         st.markdown('<div class="live-badge">● LIVE</div>', unsafe_allow_html=True)
 with col3:
-    lang_keys = list(LANGUAGES.keys())
-    current_lang = [k for k, v in LANGUAGES.items() if v[0] == st.session_state.language]
-    lang_index = lang_keys.index(current_lang[0]) if current_lang else 0
-    selected_lang = st.selectbox("", lang_keys, index=lang_index, label_visibility="collapsed", key="lang_select")
+    lang_index = LANGUAGE_CODES.index(st.session_state.language) if st.session_state.language in LANGUAGE_CODES else 0
+    selected_lang = st.selectbox("", LANGUAGE_KEYS, index=lang_index, label_visibility="collapsed", key="lang_select")
     new_lang = LANGUAGES[selected_lang][0]
 
     # Detect language change and rerun
@@ -534,7 +810,6 @@ with col3:
         st.session_state.language = new_lang
         st.session_state.prev_language = new_lang
         st.session_state.translated_articles = {}  # Clear translation cache
-        st.session_state.audio_cache = {}  # Clear audio cache (language changed)
         st.rerun()
 
 st.markdown("---")
@@ -561,15 +836,16 @@ with st.sidebar:
             st.session_state.offset = 0
             st.session_state.articles = []
             st.session_state.translated_articles = {}
-            st.session_state.audio_cache = {}
             st.rerun()
 
         if st.button(f"📥 {translate_ui('Load 10 More', st.session_state.language)}", use_container_width=True):
             with st.spinner(translate_ui("Loading", st.session_state.language)):
                 st.session_state.offset += 10
                 new = fetch_category(st.session_state.source[1], 10, st.session_state.offset)
+                seen_urls = {x['url'] for x in st.session_state.articles}
                 for a in new:
-                    if a['url'] not in [x['url'] for x in st.session_state.articles]:
+                    if a['url'] not in seen_urls:
+                        seen_urls.add(a['url'])
                         st.session_state.articles.append(a)
             st.rerun()
 
@@ -581,7 +857,6 @@ with st.sidebar:
             st.session_state.articles = []
             st.session_state.offset = 0
             st.session_state.translated_articles = {}
-            st.session_state.audio_cache = {}
             st.rerun()
 
     st.markdown("---")
@@ -594,15 +869,13 @@ with st.sidebar:
 if not st.session_state.category:
     st.markdown("### 📚 Choose Your Category")
     cols = st.columns(2)
-    cats = list(CATEGORIES.keys())
-    for i, cat in enumerate(cats):
+    for i, cat in enumerate(CATEGORY_KEYS):
         with cols[i % 2]:
             if st.button(cat, key=f"c{i}", use_container_width=True):
                 st.session_state.category = cat
                 st.session_state.articles = []
                 st.session_state.offset = 0
                 st.session_state.translated_articles = {}
-                st.session_state.audio_cache = {}
                 st.rerun()
 
 elif not st.session_state.source:
@@ -617,36 +890,52 @@ elif not st.session_state.source:
                 with st.spinner(f"{translate_ui('Loading', st.session_state.language)} {name}..."):
                     st.session_state.articles = fetch_category(url, 15, 0)
                     st.session_state.translated_articles = {}
-                    st.session_state.audio_cache = {}
                 st.rerun()
 
 else:
     if st.session_state.articles:
         st.success(f"✅ {len(st.session_state.articles)} {translate_ui('articles loaded', st.session_state.language)}")
 
+        # Summarize only the content, not the title (computed once per article, stored on it)
+        add_derived_fields(st.session_state.articles)
+        summaries_en = [art['summary'] for art in st.session_state.articles]
+
+        # Translation cache keyed by summary content hash + target language (reposted
+        # stories share one entry). Only the first TRANSLATE_EAGER missing summaries are
+        # translated before rendering; the rest show in English and are translated in one
+        # pass after the feed is drawn, followed by a rerun.
+        summary_keys = [f"{text_digest(summary)}_{st.session_state.language}" for summary in summaries_en]
+        deferred = {}
+        if st.session_state.language != "en":
+            pending = {
+                cache_key: summary
+                for cache_key, summary in zip(summary_keys, summaries_en)
+                if cache_key not in st.session_state.translated_articles
+            }
+            eager = dict(list(pending.items())[:TRANSLATE_EAGER])
+            deferred = dict(list(pending.items())[TRANSLATE_EAGER:])
+            if eager:
+                with st.spinner(f"🌐 Translating {len(eager)} articles..."):
+                    results = translate_texts(tuple(eager.values()), st.session_state.language)
+                for cache_key, trans in zip(eager, results):
+                    st.session_state.translated_articles[cache_key] = {'summary': trans}
+        listening = False
+
+        # Per-card labels depend only on the language; look them up once per run
+        summary_label = translate_ui('Quick Summary', st.session_state.language)
+        listen_label = translate_ui('Listen', st.session_state.language)
+        read_full_label = translate_ui('Read Full', st.session_state.language)
+
         for i, art in enumerate(st.session_state.articles):
             # Keep raw fetched title intact for display and speech (as requested)
             fetched_title = art.get('title', 'Article')  # from fetch_article (already uses og/title/h1)
-            display_title = clean_title_for_display(fetched_title)
+            display_title = art['display_title']
 
-            # Summarize only the content, not the title
-            summary_en = summarize(art['content'], 6)
-
-            # Translation cache keyed by article url + target language
-            cache_key = f"{art['url']}_{st.session_state.language}_summary"
-
-            if st.session_state.language != "en":
-                if cache_key not in st.session_state.translated_articles:
-                    with st.spinner(f"🌐 Translating article {i+1}..."):
-                        trans = translate_text(summary_en, st.session_state.language)
-                        st.session_state.translated_articles[cache_key] = {'summary': trans}
-                        summary_trans = trans
-                else:
-                    summary_trans = st.session_state.translated_articles[cache_key]['summary']
-            else:
-                summary_trans = summary_en
+            summary_en = summaries_en[i]
+            translated = st.session_state.translated_articles.get(summary_keys[i])
+            summary_trans = translated['summary'] if translated else summary_en
 
-            keywords = get_keywords(art['content'], 5)
+            keywords = art['keywords']
 
             # Layout: Title and time
             col1, col2 = st.columns([5, 1])
@@ -664,7 +953,9 @@ else:
                 st.markdown(kw_html, unsafe_allow_html=True)
 
             # Highlighted summary
-            st.markdown(f"**✨ {translate_ui('Quick Summary', st.session_state.language)}:**")
+            st.markdown(f"**✨ {summary_label}:**")
+            if summary_keys[i] in deferred:
+                st.caption("🌐 Translating…")
             st.markdown(
                 f"""
                 <div style="
@@ -685,7 +976,7 @@ else:
             )
 
             # Voice: generate and play on-click using gTTS (female voice default)
-            # We'll generate audio bytes and cache them in session_state.audio_cache
+            # Audio bytes are cached by generate_tts_audio (st.cache_data), keyed on text + language
             # Use the fetched_title (unchanged) + summary_trans for the narration
             # But the user asked: "it should summarize the idea of news but not title" — so we will speak the
             # title (as fetched) followed by the summary (translated if requested).
@@ -693,8 +984,7 @@ else:
             lang_code = st.session_state.language  # 'en', 'hi', 'mr', 'kn'
             # Map to gTTS supported languages if necessary; gTTS supports 'en', 'hi', 'mr' (Marathi support may be limited),
             # 'kn' might not be supported by gTTS; if unsupported, fallback to 'en' or use original language code.
-            gtts_supported = {'en', 'hi', 'mr', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'zh-cn'}
-            gtts_lang = lang_code if lang_code in gtts_supported else lang_code.split('-')[0] if lang_code.split('-')[0] in gtts_supported else 'en'
+            gtts_lang = lang_code if lang_code in GTTS_SUPPORTED else lang_code.split('-')[0] if lang_code.split('-')[0] in GTTS_SUPPORTED else 'en'
 
             # Prepare text to speak (title + summary). Title kept as fetched from source.
             to_speak = f"{fetched_title}. {summary_trans}"
@@ -703,7 +993,7 @@ else:
             if not isinstance(to_speak, str):
                 to_speak = str(to_speak)
 
-            # Cache key for audio bytes
+            # Per-article audio identity (used for the widget key)
             audio_key = f"{art['url']}_{st.session_state.language}_audio"
 
             # Button to trigger generation/playing
@@ -711,66 +1001,45 @@ else:
             play_btn_key = f"play_{i}_{hash(audio_key) & 0xffffffff}"
 
             # When user clicks the button, we generate audio (if not cached) and then show st.audio for playback
-            if st.button(f"🔊 {translate_ui('Listen', st.session_state.language)}", key=play_btn_key):
-                # Generate or fetch from cache
+            if st.button(f"🔊 {listen_label}", key=play_btn_key):
+                listening = True
+                # Generate via gTTS if available (generate_tts_audio is cached)
                 audio_bytes = None
-                if audio_key in st.session_state.audio_cache:
-                    audio_bytes = st.session_state.audio_cache[audio_key]
-                else:
-                    # Generate via gTTS if available
-                    if gTTS is not None:
-                        try:
-                            # chunk the text if very large to avoid service issues
-                            # gTTS handles long strings but we be cautious: split into ~4000-character chunks
-                            max_chunk = 4000
-                            chunks = []
-                            if len(to_speak) <= max_chunk:
-                                chunks = [to_speak]
-                            else:
-                                sents = sent_tokenize(to_speak)
-                                cur = ""
-                                for s in sents:
-                                    if len(cur) + len(s) + 1 < max_chunk:
-                                        cur += s + " "
-                                    else:
-                                        chunks.append(cur.strip())
-                                        cur = s + " "
-                                if cur.strip():
-                                    chunks.append(cur.strip())
-                            # combine bytes
-                            combined = io.BytesIO()
-                            for idx, chunk in enumerate(chunks):
-                                t = gTTS(text=chunk, lang=gtts_lang, slow=False)
-                                temp_buf = io.BytesIO()
-                                t.write_to_fp(temp_buf)
-                                temp_buf.seek(0)
-                                combined.write(temp_buf.read())
-                            audio_bytes = combined.getvalue()
-                            # cache in session
-                            st.session_state.audio_cache[audio_key] = audio_bytes
-                        except Exception as e:
-                            try:
-                                st.warning(f"Audio generation failed: {e}")
-                            except:
-                                pass
-                            audio_bytes = None
-                    else:
+                if len(to_speak.strip()) < MIN_TTS_CHARS:
+                    pass  # nothing worth speaking; falls through to the "not available" note
+                elif gTTS is not None:
+                    try:
+                        audio_bytes = generate_tts_audio(to_speak, gtts_lang)
+                    except Exception as e:
                         try:
-                            st.warning("gTTS not available. Install gTTS package to enable audio playback.")
+                            st.warning(f"Audio generation failed: {e}")
                         except:
                             pass
-                        audio_bytes = None
+                else:
+                    try:
+                        st.warning("gTTS not available. Install gTTS package to enable audio playback.")
+                    except:
+                        pass
 
                 # If we have audio bytes, play them
                 if audio_bytes:
                     # play using st.audio (Streamlit will serve bytes without saving file)
-                    st.audio(audio_bytes, format='audio/mp3')
+                    st.audio(audio_bytes, format='audio/mpeg')
                 else:
                     st.info("Audio not available for this article.")
 
             # Show read full link
-            st.markdown(f"[{translate_ui('Read Full', st.session_state.language)} →]({art['url']})")
+            st.markdown(f"[{read_full_label} →]({art['url']})")
             st.markdown("---")
 
+        # Translate the below-the-fold summaries now that the feed is on screen
+        if deferred:
+            results = translate_texts(tuple(deferred.values()), st.session_state.language)
+            for cache_key, trans in zip(deferred, results):
+                st.session_state.translated_articles[cache_key] = {'summary': trans}
+            # a rerun would drop a player the user just opened; the next interaction picks it up
+            if not listening:
+                st.rerun()
+
     else:
         st.warning(f"⚠️ No articles found. Try refreshing or selecting a different source.")